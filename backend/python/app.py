@@ -1,19 +1,33 @@
-from flask import Flask, jsonify, request
+from flask import Flask, Response, request
 from flask_cors import CORS
+from flask_compress import Compress
 import requests
-import json
+import numpy as np
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
 import time
 import os
-from datetime import datetime
+from datetime import date, datetime
 import threading
+import itertools
+import collections
+import functools
+import hashlib
 import logging
 from typing import Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 
 # Import new production-ready components
-from order_manager import OrderManager, ArbitrageExecution, FillStatus, OrderStatus
-from wallet_manager import WalletManager
+from order_manager import (
+    OrderManager,
+    ArbitrageExecution,
+    FillStatus,
+    OrderStatus,
+    DATACLASS_SLOTS,
+)
+from wallet_manager import get_wallet_manager
 
 # Configure logging
 logging.basicConfig(
@@ -32,14 +46,33 @@ CORS(
     ],
 )
 
+# gzip/brotli for the larger JSON lists; tiny bodies like /health go as-is
+app.config["COMPRESS_MIMETYPES"] = ["application/json"]
+app.config["COMPRESS_MIN_SIZE"] = 500
+Compress(app)
+
+# Serialize every API response with orjson rather than stdlib json
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def jsonify(obj):
+    """Drop-in replacement for flask.jsonify backed by orjson"""
+    return Response(orjson.dumps(obj, option=_ORJSON_OPTS), mimetype="application/json")
+
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class BotConfig:
-    """Arbitrage bot configuration - Production ready"""
+    """
+    Arbitrage bot configuration - Production ready
+
+    Immutable: updates rebind BOT_CONFIG to a new instance (see bot_config),
+    so loops can snapshot it once per iteration.
+    """
 
     enabled: bool = False
     min_edge: float = 0.5  # Minimum edge % to execute
@@ -60,7 +93,7 @@ class BotConfig:
 
 
 # Initialize production components
-wallet_manager = WalletManager()
+wallet_manager = get_wallet_manager()
 order_manager = None
 
 
@@ -85,7 +118,7 @@ def initialize_order_manager():
             # Still create mock order manager for development
             order_manager = OrderManager("https://clob.polymarket.com")
     except Exception as e:
-        logger.error(f"Failed to initialize OrderManager: {e}")
+        logger.error("Failed to initialize OrderManager: %s", e)
         logger.warning("Falling back to demo mode")
         order_manager = OrderManager("https://clob.polymarket.com")
 
@@ -95,12 +128,18 @@ def initialize_order_manager():
 # ============================================================================
 
 BOT_CONFIG = BotConfig()
+# Serializes read-modify-write updates of BOT_CONFIG. Readers take no lock:
+# they snapshot the reference once and read fields off that instance.
+config_lock = threading.RLock()
 
 # Risk management state
 risk_state = {
     "current_position_size": BOT_CONFIG.initial_position_size,
     "daily_pnl": 0.0,
-    "execution_history": [],  # List of recent execution results
+    # Recent execution results, bounded to twice the scaling window
+    "execution_history": collections.deque(maxlen=BOT_CONFIG.scaling_window * 2),
+    # BOTH_FILLED results among the last scaling_window entries
+    "recent_success_count": 0,
     "last_scaling_check": time.time(),
     "trading_enabled": True,
 }
@@ -118,6 +157,18 @@ CLOB_AUTH = {
     "private_key": os.environ.get("PM_PRIVATE_KEY", ""),
 }
 
+# Shared HTTP session - keeps TCP/TLS connections alive across scans
+HTTP = requests.Session()
+HTTP.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    ),
+)
+HTTP.headers["Connection"] = "keep-alive"
+
 # ============================================================================
 # DATA MODELS
 # ============================================================================
@@ -151,9 +202,90 @@ class ArbitrageOpportunity:
     updated_at: str
 
 
+class OpportunityBatch:
+    """
+    Structure-of-arrays view of one scan's opportunities.
+
+    Numeric columns are contiguous float64/bool arrays; per-market metadata
+    lives in parallel lists. Rows are only materialized as dicts, for the
+    API, on demand.
+    """
+
+    __slots__ = (
+        "yes",
+        "no",
+        "sum_p",
+        "edge",
+        "executable",
+        "volume",
+        "market_ids",
+        "names",
+        "updated_at",
+    )
+
+    def __init__(
+        self, yes, no, sum_p, edge, executable, volume, market_ids, names, updated_at
+    ):
+        self.yes = yes
+        self.no = no
+        self.sum_p = sum_p
+        self.edge = edge
+        self.executable = executable
+        self.volume = volume
+        self.market_ids = market_ids
+        self.names = names
+        self.updated_at = updated_at
+
+    @classmethod
+    def empty(cls):
+        f = np.empty(0, dtype=np.float64)
+        return cls(f, f, f, f, np.empty(0, dtype=bool), f, [], [], "")
+
+    def __len__(self):
+        return len(self.market_ids)
+
+    def ranked(self):
+        """Row indices sorted by edge (highest first)"""
+        return np.argsort(-self.edge, kind="stable")
+
+    def to_dicts(self, limit):
+        """
+        Serialize the top `limit` rows by edge into API dicts.
+
+        Rounding happens here, once per column for the selected rows; the
+        batch itself keeps raw floats.
+        """
+        idx = self.ranked()[:limit]
+        yes = np.round(self.yes[idx], 4).tolist()
+        no = np.round(self.no[idx], 4).tolist()
+        sum_p = np.round(self.sum_p[idx], 4).tolist()
+        edge = np.round(self.edge[idx], 2).tolist()
+        executable = self.executable[idx].tolist()
+        volume = self.volume[idx].tolist()
+        return [
+            {
+                "id": f"arb_{self.market_ids[i]}",
+                "marketName": self.names[i],
+                "marketId": self.market_ids[i],
+                "yesAsk": yes[k],
+                "noAsk": no[k],
+                "sum": sum_p[k],
+                "edge": edge[k],
+                "executable": executable[k],
+                "volume": volume[k],
+                "updatedAt": self.updated_at,
+            }
+            for k, i in enumerate(idx.tolist())
+        ]
+
+
 # Helper to create ArbitrageOpportunity with safe defaults
-def make_opportunity(market, yes_price, no_price, sum_price, edge, executable):
+def make_opportunity(
+    market, yes_price, no_price, sum_price, edge, executable, updated_at=None
+):
     """Create ArbitrageOpportunity with safe type handling"""
+    if updated_at is None:
+        updated_at = datetime.now().isoformat()
     return {
         "id": f"arb_{market.get('id', 'unknown')}",
         "market_name": market.get("question", "Unknown")[:80],
@@ -164,7 +296,7 @@ def make_opportunity(market, yes_price, no_price, sum_price, edge, executable):
         "edge": round(edge, 2),
         "executable": executable,
         "volume": float(market.get("volume", 0) or 0),
-        "updated_at": datetime.now().isoformat(),
+        "updated_at": updated_at,
     }
 
 
@@ -199,23 +331,106 @@ class ExecutionLog:
 
 markets_cache = []
 opportunities_cache = []
-execution_logs = []
-last_update = 0
+opportunities_by_id = {}  # opportunities_cache keyed by marketId
+opportunities_body = b"[]"  # opportunities_cache pre-encoded as JSON
+opportunities_batch = OpportunityBatch.empty()
+MAX_EXECUTION_LOGS = 500
+execution_logs = collections.deque(maxlen=MAX_EXECUTION_LOGS)  # newest first
+# Same entries indexed by status, so filtered /api/logs reads are a slice
+logs_by_status = collections.defaultdict(
+    lambda: collections.deque(maxlen=MAX_EXECUTION_LOGS)
+)
+last_update = 0  # wall-clock, reported by /api/bot/status
+last_update_ns = 0  # monotonic, used for scan throttling
 CACHE_DURATION = 5  # seconds
 
+# Scanner snapshot publication: each scan builds new caches off to the side,
+# swaps the references in one block and bumps opportunities_version. Readers
+# take no lock; the auto-executor waits on the version instead of sleeping.
+opportunities_version = 0
+opportunities_cond = threading.Condition()
+
+# Encoded responses of hot read-only endpoints (see cached_json), keyed by
+# name. cache_versions[name] is bumped whenever the data behind it changes.
+_resp_cache = {}
+cache_versions = collections.Counter()
+RESPONSE_CACHE_TTL = 1  # seconds, bounds staleness of unversioned fields
+
+# (epoch second, ISO string) of the last now_iso() format
+_ts_cache = (0, "")
+
+# Raw outcomePrices strings of empty or fully resolved markets
+_BOUNDARY_PRICES = frozenset(("[]", '["0", "0"]', '["1", "0"]', '["0", "1"]'))
+
+# Dashboard metrics, pre-aggregated as BOTH_FILLED logs are recorded so
+# /api/metrics never rescans execution_logs
+metrics_state = {
+    "total_pnl": 0.0,
+    "total_trades": 0,
+    "sum_edge": 0.0,
+    "pnl_by_day": collections.deque([0.0] * 7, maxlen=7),  # oldest -> today
+    "day_ordinal": date.today().toordinal(),  # day of pnl_by_day[-1]
+}
+metrics_lock = threading.Lock()
+
 # Active executions tracking
 active_executions = {}
 execution_counter = 0
+_exec_counter = itertools.count()  # manual /api/execute ids; next() is atomic
+
+# Serializes read-modify-write updates to risk_state and execution_counter.
+# Executions may run on the auto-executor and on request threads at once.
+risk_lock = threading.Lock()
+
+
+def now_iso(t=None):
+    """Second-resolution ISO timestamp, formatted at most once per second"""
+    global _ts_cache
+    if t is None:
+        t = int(time.time())
+    cached = _ts_cache
+    if cached[0] != t:
+        cached = (t, datetime.fromtimestamp(t).isoformat())
+        _ts_cache = cached
+    return cached[1]
+
+
+def bump(*names):
+    """Invalidate the cached responses of the given endpoints"""
+    for name in names:
+        cache_versions[name] += 1
+
 
 # ============================================================================
 # POLYMARKET API CLIENT
 # ============================================================================
 
 
+def _parse_outcome_prices(market):
+    """(yes, no) prices from a market's outcomePrices, or None if unusable"""
+    raw = market.get("outcomePrices", "")
+    if not raw or (isinstance(raw, str) and raw in _BOUNDARY_PRICES):
+        return None
+
+    try:
+        price_list = orjson.loads(raw) if isinstance(raw, str) else raw
+        if len(price_list) < 2:
+            return None
+        return float(price_list[0]), float(price_list[1])
+    except (ValueError, TypeError) as e:  # incl. orjson.JSONDecodeError
+        logger.debug("Failed to parse prices for market %s: %s", market.get("id"), e)
+        return None
+
+
 def fetch_active_markets():
-    """Fetch active markets from Gamma API"""
+    """
+    Fetch active markets from Gamma API
+
+    Returns (markets, prices): the markets with valid price data, and a
+    parallel list of their parsed (yes, no) prices for the analyzers.
+    """
     try:
-        response = requests.get(
+        response = HTTP.get(
             f"{GAMMA_API}/markets",
             params={
                 "limit": 100,
@@ -227,45 +442,32 @@ def fetch_active_markets():
             timeout=10,
         )
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
 
         # Filter for markets with valid price data
         valid_markets = []
+        valid_prices = []
         for market in data:
-            prices = market.get("outcomePrices", "")
-            if prices and prices not in [
-                "[]",
-                '["0", "0"]',
-                '["1", "0"]',
-                '["0", "1"]',
-            ]:
-                try:
-                    price_list = (
-                        json.loads(prices) if isinstance(prices, str) else prices
-                    )
-                    if (
-                        len(price_list) >= 2
-                        and float(price_list[0]) > 0
-                        and float(price_list[1]) > 0
-                    ):
-                        valid_markets.append(market)
-                except (json.JSONDecodeError, ValueError, TypeError):
-                    continue
+            parsed = _parse_outcome_prices(market)
+            if parsed and parsed[0] > 0 and parsed[1] > 0:
+                valid_markets.append(market)
+                valid_prices.append(parsed)
 
         logger.info(
-            f"Fetched {len(data)} markets, {len(valid_markets)} with valid prices"
+            "Fetched %d markets, %d with valid prices", len(data), len(valid_markets)
         )
-        return valid_markets
+        return valid_markets, valid_prices
 
     except Exception as e:
-        logger.error(f"Failed to fetch markets: {e}")
-        return []
+        logger.error("Failed to fetch markets: %s", e)
+        return [], []
 
 
 def get_order_book(market_id):
     """
     Get order book for a market.
     NOTE: Full order book requires CLOB API authentication.
+    Use the shared HTTP session once this is wired to the CLOB API.
     """
     # In production, use CLOB API with authentication
     return None
@@ -276,131 +478,163 @@ def get_order_book(market_id):
 # ============================================================================
 
 
-def analyze_market_for_arbitrage(market):
+def _scan_kernel(yes, no, min_edge_pct):
     """
-    CORE LOGIC: Compute price(YES) + price(NO)
+    CORE LOGIC: Compute price(YES) + price(NO) for every market in a scan
 
     If sum < 1.00 by enough margin, we have an arbitrage opportunity.
 
     Edge = (1.00 - (yes_price + no_price)) * 100
     Positive edge = guaranteed profit if both fills execute.
+
+    Returns (sum_p, edge, valid, executable) arrays. Works in place where it
+    can so a scan allocates only the four result arrays.
     """
-    try:
-        # Extract prices
-        prices = market.get("outcomePrices", "")
-        if not prices or prices in ["[]", '["0", "0"]', '["1", "0"]', '["0", "1"]']:
-            return None
+    # CORE CALCULATION
+    sum_p = np.add(yes, no)
+    edge = np.subtract(1.0, sum_p)
+    edge *= 100  # Positive = arbitrage opportunity
 
-        try:
-            price_list = json.loads(prices) if isinstance(prices, str) else prices
-            if len(price_list) < 2:
-                return None
+    # Skip markets at price boundaries (fully resolved)
+    valid = yes > 0.01
+    valid &= yes < 0.99
+    valid &= no > 0.01
+    valid &= no < 0.99
 
-            yes_price = float(price_list[0])
-            no_price = float(price_list[1])
+    # For demo: create opportunities when edge is small but positive
+    # In production, you'd need ~0.5%+ edge after fees and slippage
+    executable = edge > min_edge_pct * 0.1
 
-        except (ValueError, TypeError, json.JSONDecodeError) as e:
-            logger.debug(f"Failed to parse prices for market {market.get('id')}: {e}")
-            return None
+    return sum_p, edge, valid, executable
 
-        # Skip if prices are at boundaries (fully resolved markets)
-        if yes_price >= 0.99 or no_price >= 0.99:
-            return None
-        if yes_price <= 0.01 or no_price <= 0.01:
-            return None
 
-        # CORE CALCULATION
-        sum_price = yes_price + no_price
-        edge = (1.0 - sum_price) * 100  # Positive = arbitrage opportunity
-
-        # For demo: create opportunities when edge is small but positive
-        # In production, you'd need ~0.5%+ edge after fees and slippage
-        executable = edge > BOT_CONFIG.min_edge * 0.1
-
-        # DISPLAY ALL MARKETS - Show real data for user analysis
-        # Even markets with 0% edge are shown so user can see the data
-
-        # Use actual volume from market
-        volume = float(market.get("volume", 0) or 0)
-
-        return ArbitrageOpportunity(
-            id=f"arb_{market['id']}",
-            market_name=market.get("question", "Unknown")[:80],
-            market_id=market.get("id"),
-            yes_ask=round(yes_price, 4),
-            no_ask=round(no_price, 4),
-            sum_price=round(sum_price, 4),
-            edge=round(edge, 2),
-            executable=executable,
-            volume=volume,
-            updated_at=datetime.now().isoformat(),
-        )
+def _scan_rows(markets, prices=None):
+    """
+    Per-market inputs for a scan as parallel lists:
+    (prices, market_ids, names, volumes).
 
-    except Exception as e:
-        logger.error(f"Error analyzing market {market.get('id', 'unknown')}: {e}")
-        return None
+    `prices` is the parallel list fetch_active_markets returns; without it
+    outcomePrices is parsed here. A market whose prices or metadata can't be
+    read is logged and dropped, so one bad row never fails the whole scan.
+    """
+    if prices is None:
+        prices = [_parse_outcome_prices(market) for market in markets]
+
+    parsed_prices, market_ids, names, volumes = [], [], [], []
+    for market, parsed in zip(markets, prices):
+        if parsed is None:
+            continue
+        try:
+            market_id = market.get("id")
+            name = market.get("question", "Unknown")[:80]
+            volume = float(market.get("volume", 0) or 0)
+        except (ValueError, TypeError) as e:
+            logger.warning("Skipping malformed market %s: %s", market.get("id"), e)
+            continue
+        parsed_prices.append(parsed)
+        market_ids.append(market_id)
+        names.append(name)
+        volumes.append(volume)
+
+    return parsed_prices, market_ids, names, volumes
+
+
+def analyze_markets_np(markets, updated_at=None, prices=None):
+    """
+    Analyze a scan's markets for arbitrage in one batch.
+
+    Prices are parsed once per market (or taken from `prices`, the parallel
+    list fetch_active_markets returns), then sum/edge and the boundary
+    filter are computed over the whole batch with NumPy ufuncs instead of
+    scalar Python arithmetic per market. Returns an OpportunityBatch holding
+    only the rows that pass the boundary filter.
+    """
+    prices, market_ids, names, volumes = _scan_rows(markets, prices)
+    if not prices:
+        return OpportunityBatch.empty()
+
+    arr = np.fromiter(
+        itertools.chain.from_iterable(prices), dtype=np.float64, count=2 * len(prices)
+    ).reshape(-1, 2)
+    yes = arr[:, 0]
+    no = arr[:, 1]
+
+    sum_p, edge, mask, executable_mask = _scan_kernel(yes, no, BOT_CONFIG.min_edge)
+
+    keep = np.flatnonzero(mask).tolist()
+    return OpportunityBatch(
+        yes=yes[mask],
+        no=no[mask],
+        sum_p=sum_p[mask],
+        edge=edge[mask],
+        executable=executable_mask[mask],
+        volume=np.array(volumes, dtype=np.float64)[mask],
+        market_ids=[market_ids[i] for i in keep],
+        names=[names[i] for i in keep],
+        updated_at=updated_at or datetime.now().isoformat(),
+    )
 
 
 def scan_for_opportunities():
     """Main scanning loop - runs continuously"""
-    global markets_cache, opportunities_cache, last_update
+    global markets_cache, opportunities_cache, opportunities_body, opportunities_batch
+    global opportunities_by_id
+    global opportunities_version, last_update, last_update_ns
 
     logger.info("Starting arbitrage scanner...")
 
     while True:
         try:
-            current_time = time.time()
+            now_ns = time.monotonic_ns()
 
-            # Throttle API calls
-            if current_time - last_update < (CACHE_DURATION / 1000):
-                time.sleep(1)
+            # Throttle API calls - sleep exactly the remaining cooldown
+            remaining_ns = CACHE_DURATION * 1_000_000_000 - (now_ns - last_update_ns)
+            if remaining_ns > 0:
+                time.sleep(remaining_ns / 1e9)
                 continue
 
             # Fetch fresh market data
-            markets = fetch_active_markets()
-            markets_cache = markets
+            markets, prices = fetch_active_markets()
 
             # Analyze for arbitrage
-            opportunities = []
-            for market in markets[:50]:  # Top 50 by volume
-                opp = analyze_market_for_arbitrage(market)
-                if opp:
-                    opportunities.append(opp)
-
-            # Sort by edge (highest first)
-            opportunities.sort(key=lambda x: x.edge, reverse=True)
-
-            # Store for API
-            global opportunities_cache
-            opportunities_cache = [
-                {
-                    "id": o.id,
-                    "marketName": o.market_name,
-                    "marketId": o.market_id,
-                    "yesAsk": o.yes_ask,
-                    "noAsk": o.no_ask,
-                    "sum": o.sum_price,
-                    "edge": o.edge,
-                    "executable": o.executable,
-                    "volume": o.volume,
-                    "updatedAt": o.updated_at,
-                }
-                for o in opportunities[:20]
-            ]
-
-            last_update = current_time
+            # One timestamp per scan tick, shared by every row
+            updated_at = datetime.now().isoformat()
+            # Top 50 by volume
+            batch = analyze_markets_np(markets[:50], updated_at, prices[:50])
+
+            # Store top opportunities (by edge) for API
+            new_cache = batch.to_dicts(20)
+            # Encoded once per scan; every poll until the next scan reuses it
+            new_body = orjson.dumps(new_cache, option=_ORJSON_OPTS)
+
+            new_by_id = {o["marketId"]: o for o in new_cache}
+
+            # Publish the snapshot and wake the auto-executor
+            with opportunities_cond:
+                markets_cache = markets
+                opportunities_cache = new_cache
+                opportunities_by_id = new_by_id
+                opportunities_body = new_body
+                opportunities_batch = batch
+                last_update = time.time()
+                opportunities_version += 1
+                bump("opportunities", "markets", "status", "health")
+                opportunities_cond.notify_all()
+
+            last_update_ns = now_ns
 
             # Log scan summary
-            if opportunities:
+            if len(batch):
                 logger.info(
-                    f"Scan complete: {len(opportunities)} opportunities, "
-                    f"top edge: {opportunities[0].edge:.2f}%"
+                    "Scan complete: %d opportunities, top edge: %.2f%%",
+                    len(batch),
+                    batch.edge.max(),
                 )
 
             time.sleep(BOT_CONFIG.scan_interval / 1000)
 
         except Exception as e:
-            logger.error(f"Error in scanner loop: {e}")
+            logger.error("Error in scanner loop: %s", e)
             time.sleep(5)
 
 
@@ -418,7 +652,10 @@ def place_order(market_id, token_id, side, price, size):
     """
     if not CLOB_AUTH["private_key"]:
         logger.debug(
-            f"Order placement skipped (no API key): market={market_id}, side={side}, price={price}"
+            "Order placement skipped (no API key): market=%s, side=%s, price=%s",
+            market_id,
+            side,
+            price,
         )
         return None
 
@@ -430,6 +667,49 @@ def place_order(market_id, token_id, side, price, size):
     return None  # Demo: no actual order placed
 
 
+def record_execution(result):
+    """
+    Append to execution_history, keeping recent_success_count in sync.
+    Callers hold risk_lock.
+    """
+    history = risk_state["execution_history"]
+    window = BOT_CONFIG.scaling_window
+
+    # The entry at -window slides out of the scaling window on this append
+    if len(history) >= window:
+        if history[-window].get("status") == ExecutionStatus.BOTH_FILLED:
+            risk_state["recent_success_count"] -= 1
+
+    history.append(result)
+    if result.get("status") == ExecutionStatus.BOTH_FILLED:
+        risk_state["recent_success_count"] += 1
+
+
+def _roll_metrics_day():
+    """Shift pnl_by_day forward to today. Callers hold metrics_lock."""
+    today = date.today().toordinal()
+    elapsed = today - metrics_state["day_ordinal"]
+    if elapsed > 0:
+        metrics_state["pnl_by_day"].extend([0.0] * min(elapsed, 7))
+        metrics_state["day_ordinal"] = today
+
+
+def record_execution_log(log_entry):
+    """Prepend an execution log entry and fold it into metrics_state"""
+    execution_logs.appendleft(log_entry)
+    logs_by_status[log_entry["status"]].appendleft(log_entry)
+
+    if log_entry["status"] != ExecutionStatus.BOTH_FILLED.value:
+        return
+
+    with metrics_lock:
+        _roll_metrics_day()
+        metrics_state["total_pnl"] += log_entry["pnl"]
+        metrics_state["total_trades"] += 1
+        metrics_state["sum_edge"] += log_entry["expected_edge"]
+        metrics_state["pnl_by_day"][-1] += log_entry["pnl"]
+
+
 def get_adaptive_position_size():
     """Calculate position size based on recent performance (risk management scaling)"""
     global risk_state
@@ -437,7 +717,9 @@ def get_adaptive_position_size():
     # Check emergency stop loss
     if risk_state["daily_pnl"] <= BOT_CONFIG.emergency_stop_loss:
         logger.critical(
-            f"🚨 EMERGENCY STOP: Daily loss ${risk_state['daily_pnl']:.2f} exceeds threshold ${BOT_CONFIG.emergency_stop_loss:.2f}"
+            "🚨 EMERGENCY STOP: Daily loss $%.2f exceeds threshold $%.2f",
+            risk_state["daily_pnl"],
+            BOT_CONFIG.emergency_stop_loss,
         )
         risk_state["trading_enabled"] = False
         return 0.0
@@ -445,18 +727,15 @@ def get_adaptive_position_size():
     # Check if we have enough history for scaling
     if len(risk_state["execution_history"]) < BOT_CONFIG.scaling_window:
         logger.info(
-            f"Using initial position size: ${risk_state['current_position_size']:.2f} (building history: {len(risk_state['execution_history'])}/{BOT_CONFIG.scaling_window})"
+            "Using initial position size: $%.2f (building history: %d/%d)",
+            risk_state["current_position_size"],
+            len(risk_state["execution_history"]),
+            BOT_CONFIG.scaling_window,
         )
         return risk_state["current_position_size"]
 
-    # Calculate success rate over scaling window
-    recent_executions = risk_state["execution_history"][-BOT_CONFIG.scaling_window :]
-    successful_executions = sum(
-        1
-        for exec_result in recent_executions
-        if exec_result.get("status") == ExecutionStatus.BOTH_FILLED
-    )
-    success_rate = successful_executions / len(recent_executions)
+    # Success rate over scaling window (count maintained by record_execution)
+    success_rate = risk_state["recent_success_count"] / BOT_CONFIG.scaling_window
 
     # Scale position size based on success rate
     if success_rate >= BOT_CONFIG.min_success_rate:
@@ -467,7 +746,10 @@ def get_adaptive_position_size():
         )
         if new_size > risk_state["current_position_size"]:
             logger.info(
-                f"📈 Scaling up position size: ${risk_state['current_position_size']:.2f} → ${new_size:.2f} (success rate: {success_rate:.1%})"
+                "📈 Scaling up position size: $%.2f → $%.2f (success rate: %.1f%%)",
+                risk_state["current_position_size"],
+                new_size,
+                success_rate * 100,
             )
             risk_state["current_position_size"] = new_size
     else:
@@ -478,7 +760,10 @@ def get_adaptive_position_size():
         )
         if new_size < risk_state["current_position_size"]:
             logger.warning(
-                f"📉 Scaling down position size: ${risk_state['current_position_size']:.2f} → ${new_size:.2f} (success rate: {success_rate:.1%})"
+                "📉 Scaling down position size: $%.2f → $%.2f (success rate: %.1f%%)",
+                risk_state["current_position_size"],
+                new_size,
+                success_rate * 100,
             )
             risk_state["current_position_size"] = new_size
 
@@ -500,18 +785,13 @@ def execute_arbitrage_opportunity(opp, position_size=None):
 
     Returns ArbitrageExecution with complete result data.
     """
-    global \
-        execution_counter, \
-        execution_logs, \
-        active_executions, \
-        order_manager, \
-        risk_state
+    global execution_counter, active_executions, order_manager, risk_state
 
     # Check if trading is enabled
     if not risk_state["trading_enabled"]:
         logger.warning("Trading is disabled due to risk management")
         return {
-            "id": f"exec_{int(time.time())}_{execution_counter}",
+            "id": f"exec_{time.monotonic_ns()}_{execution_counter}",
             "timestamp": datetime.now().isoformat(),
             "market": opp.market_name,
             "market_id": opp.market_id,
@@ -523,12 +803,13 @@ def execute_arbitrage_opportunity(opp, position_size=None):
 
     # Use adaptive position sizing if not specified
     if position_size is None:
-        position_size = get_adaptive_position_size()
+        with risk_lock:
+            position_size = get_adaptive_position_size()
 
     # Skip if position size is 0 (emergency stop)
     if position_size <= 0:
         return {
-            "id": f"exec_{int(time.time())}_{execution_counter}",
+            "id": f"exec_{time.monotonic_ns()}_{execution_counter}",
             "timestamp": datetime.now().isoformat(),
             "market": opp.market_name,
             "market_id": opp.market_id,
@@ -538,22 +819,24 @@ def execute_arbitrage_opportunity(opp, position_size=None):
             "execution_time": 0.0,
         }
 
-    execution_id = f"exec_{int(time.time())}_{execution_counter}"
-    execution_counter += 1
+    with risk_lock:
+        execution_id = f"exec_{time.monotonic_ns()}_{execution_counter}"
+        execution_counter += 1
 
-    start_time = time.time()
+    start_ns = time.monotonic_ns()
 
     # Comprehensive logging as per specification
-    logger.info(f"=== ARBITRAGE EXECUTION START: {execution_id} ===")
-    logger.info(f"Timestamp: {datetime.now().isoformat()}")
-    logger.info(f"Market ID: {opp.market_id}")
-    logger.info(f"Market: {opp.market_name[:50]}")
-    logger.info(f"YES Ask: ${opp.yes_ask:.4f}")
-    logger.info(f"NO Ask: ${opp.no_ask:.4f}")
-    logger.info(f"Sum Ask: ${opp.sum_price:.4f}")
-    logger.info(f"Raw Edge: {opp.edge:.2f}%")
-    logger.info(f"Position Size: ${position_size:.2f} per leg")
-    logger.info(f"Order Sizes: {position_size}")
+    logger.info("=== ARBITRAGE EXECUTION START: %s ===", execution_id)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Timestamp: %s", datetime.now().isoformat())
+    logger.info("Market ID: %s", opp.market_id)
+    logger.info("Market: %.50s", opp.market_name)
+    logger.info("YES Ask: $%.4f", opp.yes_ask)
+    logger.info("NO Ask: $%.4f", opp.no_ask)
+    logger.info("Sum Ask: $%.4f", opp.sum_price)
+    logger.info("Raw Edge: %.2f%%", opp.edge)
+    logger.info("Position Size: $%.2f per leg", position_size)
+    logger.info("Order Sizes: %s", position_size)
 
     # Initialize OrderManager if needed
     if order_manager is None:
@@ -575,9 +858,10 @@ def execute_arbitrage_opportunity(opp, position_size=None):
             "status": ExecutionStatus.FAILED,
             "pnl": 0.0,
             "details": "OrderManager initialization failed",
-            "execution_time": time.time() - start_time,
+            "execution_time": (time.monotonic_ns() - start_ns) / 1e9,
         }
-        risk_state["execution_history"].append(result)
+        with risk_lock:
+            record_execution(result)
         return result
 
     try:
@@ -588,25 +872,31 @@ def execute_arbitrage_opportunity(opp, position_size=None):
             no_price=opp.no_ask,
             position_size=position_size,
             max_wait_time=BOT_CONFIG.execution_timeout,
+            # min_edge is a percentage here, a dollar edge in OrderManager
+            min_edge=BOT_CONFIG.min_edge / 100,
         )
 
-        execution_time = time.time() - start_time
+        execution_time = (time.monotonic_ns() - start_ns) / 1e9
 
         # Log execution results as per specification
-        logger.info(f"=== ARBITRAGE EXECUTION COMPLETE: {execution_id} ===")
-        logger.info(f"Execution Time: {execution_time:.2f}s")
-        logger.info(f"Fill Status: {execution.fill_status.value}")
-        logger.info(f"PnL: ${execution.pnl:.4f}")
-        logger.info(f"Notes: {execution.notes}")
+        logger.info("=== ARBITRAGE EXECUTION COMPLETE: %s ===", execution_id)
+        logger.info("Execution Time: %.2fs", execution_time)
+        logger.info("Fill Status: %s", execution.fill_status.value)
+        logger.info("PnL: $%.4f", execution.pnl)
+        logger.info("Notes: %s", execution.notes)
 
         # Log order details if available
         if execution.yes_order:
             logger.info(
-                f"YES Order: {execution.yes_order.order_id} - {execution.yes_order.status.value}"
+                "YES Order: %s - %s",
+                execution.yes_order.order_id,
+                execution.yes_order.status.value,
             )
         if execution.no_order:
             logger.info(
-                f"NO Order: {execution.no_order.order_id} - {execution.no_order.status.value}"
+                "NO Order: %s - %s",
+                execution.no_order.order_id,
+                execution.no_order.status.value,
             )
 
         # Convert to legacy format for backward compatibility
@@ -616,6 +906,13 @@ def execute_arbitrage_opportunity(opp, position_size=None):
             details = execution.notes
             yes_filled = True
             no_filled = True
+        elif execution.fill_status == FillStatus.SKIPPED:
+            # Nothing was placed: not a failure for the scaling window
+            status = ExecutionStatus.CANCELLED
+            pnl = 0.0
+            details = execution.notes
+            yes_filled = False
+            no_filled = False
         elif execution.fill_status == FillStatus.ONE_FILLED:
             status = ExecutionStatus.PARTIAL_FILL
             pnl = execution.pnl
@@ -645,38 +942,35 @@ def execute_arbitrage_opportunity(opp, position_size=None):
                     f" ⚠️ WARNING: Market {execution.market_id} has naked exposure"
                 )
                 logger.warning(
-                    f"Position validation: Market {execution.market_id} has naked exposure"
+                    "Position validation: Market %s has naked exposure",
+                    execution.market_id,
                 )
 
-        # Update risk management state
-        risk_state["execution_history"].append(
-            {
-                "id": execution_id,
-                "timestamp": datetime.now().isoformat(),
-                "market_id": opp.market_id,
-                "status": status,
-                "pnl": pnl,
-                "position_size": position_size,
-                "execution_time": execution_time,
-            }
-        )
-
-        risk_state["daily_pnl"] += pnl
-
-        # Keep only recent execution history for performance
-        max_history = BOT_CONFIG.scaling_window * 2
-        if len(risk_state["execution_history"]) > max_history:
-            risk_state["execution_history"] = risk_state["execution_history"][
-                -max_history:
-            ]
+        # Update risk management state (pre-trade aborts don't count)
+        with risk_lock:
+            if status != ExecutionStatus.CANCELLED:
+                record_execution(
+                    {
+                        "id": execution_id,
+                        "timestamp": datetime.now().isoformat(),
+                        "market_id": opp.market_id,
+                        "status": status,
+                        "pnl": pnl,
+                        "position_size": position_size,
+                        "execution_time": execution_time,
+                    }
+                )
+            risk_state["daily_pnl"] += pnl
 
         logger.info(
-            f"Risk state updated - Daily PnL: ${risk_state['daily_pnl']:.2f}, Current size: ${risk_state['current_position_size']:.2f}"
+            "Risk state updated - Daily PnL: $%.2f, Current size: $%.2f",
+            risk_state["daily_pnl"],
+            risk_state["current_position_size"],
         )
 
     except Exception as e:
-        logger.error(f"Arbitrage execution failed: {e}")
-        execution_time = time.time() - start_time
+        logger.error("Arbitrage execution failed: %s", e)
+        execution_time = (time.monotonic_ns() - start_ns) / 1e9
         status = ExecutionStatus.FAILED
         pnl = 0.0
         details = f"Execution error: {str(e)}"
@@ -698,13 +992,10 @@ def execute_arbitrage_opportunity(opp, position_size=None):
         "pnl": round(pnl, 2),
     }
 
-    execution_logs.insert(0, log_entry)
-    # Keep only last 500 logs
-    if len(execution_logs) > 500:
-        execution_logs = execution_logs[:500]
+    record_execution_log(log_entry)
 
     logger.info(
-        f"Execution complete: {execution_id} - {status.value} - PnL: ${pnl:.2f}"
+        "Execution complete: %s - %s - PnL: $%.2f", execution_id, status.value, pnl
     )
 
     return ExecutionResult(
@@ -728,36 +1019,45 @@ def auto_execute_arbitrage():
 
     logger.info("Starting auto-execute loop...")
 
+    last_version = 0
+
     while True:
         try:
+            # Snapshot the (immutable) config once per iteration
+            config = BOT_CONFIG
+
             # Check if bot is enabled and under execution limit
-            if not BOT_CONFIG.enabled:
+            if not config.enabled:
                 time.sleep(1)
                 continue
 
-            if len(active_executions) >= BOT_CONFIG.max_concurrent_executions:
+            if len(active_executions) >= config.max_concurrent_executions:
                 time.sleep(0.5)
                 continue
 
-            # Find best executable opportunity
-            for opp_dict in opportunities_cache:
-                if not opp_dict.get("executable", False):
-                    continue
-                if opp_dict.get("edge", 0) < BOT_CONFIG.min_edge:
+            # Wait for the scanner to publish a snapshot we haven't seen yet
+            with opportunities_cond:
+                if not opportunities_cond.wait_for(
+                    lambda: opportunities_version != last_version, timeout=5
+                ):
                     continue
+                last_version = opportunities_version
+                batch = opportunities_batch
+
+            # Find best executable opportunity straight off the batch columns
+            candidates = np.flatnonzero(
+                batch.executable & (batch.edge >= config.min_edge)
+            )
+            if candidates.size:
+                i = candidates[np.argmax(batch.edge[candidates])]
 
                 # Execute (with simulated fills for demo)
-                position_size = min(
-                    BOT_CONFIG.max_position_size, opp_dict.get("volume", 100) / 10
-                )
+                position_size = min(config.max_position_size, batch.volume[i] / 10)
 
                 # For demo, skip actual execution
-                break
-
-            time.sleep(2)
 
         except Exception as e:
-            logger.error(f"Error in auto-execute loop: {e}")
+            logger.error("Error in auto-execute loop: %s", e)
             time.sleep(5)
 
 
@@ -765,68 +1065,126 @@ def auto_execute_arbitrage():
 # STARTUP
 # ============================================================================
 
-# Start background threads
-scanner_thread = threading.Thread(target=scan_for_opportunities, daemon=True)
-scanner_thread.start()
+scanner_thread = None
+auto_exec_thread = None
+
+
+def start_background_workers():
+    """Start the scanner and auto-execute threads (once per process)"""
+    global scanner_thread, auto_exec_thread
+
+    if scanner_thread is not None:
+        return
+
+    scanner_thread = threading.Thread(target=scan_for_opportunities, daemon=True)
+    scanner_thread.start()
+
+    auto_exec_thread = threading.Thread(target=auto_execute_arbitrage, daemon=True)
+    auto_exec_thread.start()
 
-auto_exec_thread = threading.Thread(target=auto_execute_arbitrage, daemon=True)
-auto_exec_thread.start()
+
+# Threads are no longer started as an import side effect. Under a WSGI server
+# the module is imported rather than run, so set RUN_SCANNER=1 in exactly one
+# serving process (e.g. a single gthread worker) to start the workers there.
+if os.environ.get("RUN_SCANNER") == "1":
+    start_background_workers()
 
 # ============================================================================
 # API ROUTES
 # ============================================================================
 
 
+def _etag_matches(etag):
+    """If-None-Match check that ignores Flask-Compress's ":<encoding>" suffix"""
+    if_none_match = request.if_none_match
+    if if_none_match.star_tag:
+        return True
+    return any(
+        tag.partition(":")[0] == etag for tag in if_none_match.as_set(include_weak=True)
+    )
+
+
+def cached_json(name):
+    """
+    Serve a read-only endpoint from an encoded-once response cache
+
+    The view's payload is encoded (views may also return ready JSON bytes)
+    at most once per cache_versions[name] and RESPONSE_CACHE_TTL. Clients
+    sending a matching If-None-Match get an empty 304.
+    """
+
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper():
+            now_ns = time.monotonic_ns()
+            version = cache_versions[name]
+            entry = _resp_cache.get(name)
+            if entry is None or entry[0] != version or now_ns >= entry[1]:
+                body = view()
+                if not isinstance(body, bytes):
+                    body = orjson.dumps(body, option=_ORJSON_OPTS)
+                etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+                entry = (
+                    version,
+                    now_ns + RESPONSE_CACHE_TTL * 1_000_000_000,
+                    body,
+                    etag,
+                )
+                _resp_cache[name] = entry
+
+            etag = entry[3]
+            headers = {"ETag": f'"{etag}"', "Cache-Control": "max-age=1"}
+            if _etag_matches(etag):
+                return Response(status=304, headers=headers)
+            return Response(entry[2], mimetype="application/json", headers=headers)
+
+        return wrapper
+
+    return decorator
+
+
 @app.route("/health")
+@cached_json("health")
 def health():
-    return jsonify(
-        {
-            "status": "healthy",
-            "timestamp": datetime.now().isoformat(),
-            "bot_enabled": BOT_CONFIG.enabled,
-            "opportunities_count": len(opportunities_cache),
-            "active_executions": len(active_executions),
-        }
-    )
+    return {
+        "status": "healthy",
+        "timestamp": now_iso(),
+        "bot_enabled": BOT_CONFIG.enabled,
+        "opportunities_count": len(opportunities_cache),
+        "active_executions": len(active_executions),
+    }
 
 
 @app.route("/api/opportunities")
+@cached_json("opportunities")
 def get_opportunities():
     """Get current arbitrage opportunities"""
-    return jsonify(opportunities_cache)
+    return opportunities_body
 
 
 @app.route("/api/markets")
+@cached_json("markets")
 def get_markets():
     """Get active markets"""
-    return jsonify(markets_cache)
+    return markets_cache
 
 
 @app.route("/api/metrics")
 def get_metrics():
     """Get dashboard metrics"""
-    # Calculate metrics from execution logs
-    filled_logs = [l for l in execution_logs if l["status"] == "BOTH_FILLED"]
-    total_pnl = sum(l["pnl"] for l in filled_logs)
-    total_trades = len(filled_logs)
-    avg_edge = (
-        sum(l["expected_edge"] for l in filled_logs) / total_trades
-        if total_trades > 0
-        else 0
-    )
-
-    # Generate PnL history (last 7 days)
-    pnl_history = [0] * 7
-    today_pnl = total_pnl
-    if total_pnl > 0:
-        pnl_history[-1] = total_pnl
+    # Read the running aggregates maintained by record_execution_log
+    with metrics_lock:
+        _roll_metrics_day()
+        total_trades = metrics_state["total_trades"]
+        avg_edge = metrics_state["sum_edge"] / total_trades if total_trades > 0 else 0
+        pnl_history = list(metrics_state["pnl_by_day"])  # last 7 days
 
     return jsonify(
         {
-            "todayPnL": round(today_pnl, 2),
+            "todayPnL": pnl_history[-1],
             "tradesExecuted": total_trades,
             "winRate": 100.0 if total_trades > 0 else 0,
-            "avgEdge": round(avg_edge, 2),
+            "avgEdge": avg_edge,
             "pnlHistory": pnl_history,
             "opportunitiesCount": len(opportunities_cache),
         }
@@ -836,79 +1194,113 @@ def get_metrics():
 @app.route("/api/logs")
 def get_logs():
     """Get execution logs"""
-    limit = int(request.args.get("limit", 100))
+    limit = max(0, int(request.args.get("limit", 100)))  # islice rejects < 0
     status_filter = request.args.get("status", None)
 
-    logs = execution_logs[:limit]
-    if status_filter:
-        logs = [l for l in logs if l["status"] == status_filter]
+    # Filter first, then take the newest `limit` entries of that status
+    source = logs_by_status.get(status_filter, ()) if status_filter else execution_logs
+    # Snapshot the entries (not their encoding) so writers can keep appending
+    logs = list(itertools.islice(source, limit))
 
+    # One buffered body so Flask-Compress can gzip the (largest) list endpoint
     return jsonify(logs)
 
 
+# POST /api/bot/config fields: (request key, type cast, BotConfig attribute)
+_BOT_FIELDS = (
+    ("enabled", bool, "enabled"),
+    ("min_edge", float, "min_edge"),
+    ("max_position_size", float, "max_position_size"),
+    ("execution_timeout", int, "execution_timeout"),
+    ("scan_interval", int, "scan_interval"),
+)
+
+# (BotConfig, /api/bot/config body, /api/bot/status "config" section) for the
+# current BOT_CONFIG instance; rebuilt only when the config is replaced
+_config_views = (None, b"", {})
+
+
+def config_views(config):
+    """Response pieces that depend only on the (immutable) bot config"""
+    global _config_views
+    cached = _config_views
+    if cached[0] is not config:
+        body = orjson.dumps(
+            {
+                "enabled": config.enabled,
+                "minEdge": config.min_edge,
+                "maxPositionSize": config.max_position_size,
+                "executionTimeout": config.execution_timeout,
+                "scanInterval": config.scan_interval,
+            }
+        )
+        status_config = {
+            "minEdge": config.min_edge,
+            "maxPositionSize": config.max_position_size,
+            "maxExecutionWait": config.execution_timeout,
+        }
+        cached = (config, body, status_config)
+        _config_views = cached
+    return cached
+
+
 @app.route("/api/bot/config", methods=["GET", "POST"])
 def bot_config():
     """Get or update bot configuration"""
+    global BOT_CONFIG
+
+    config = BOT_CONFIG
     if request.method == "POST":
-        data = request.get_json()
-
-        if "enabled" in data:
-            BOT_CONFIG.enabled = bool(data["enabled"])
-        if "min_edge" in data:
-            BOT_CONFIG.min_edge = float(data["min_edge"])
-        if "max_position_size" in data:
-            BOT_CONFIG.max_position_size = float(data["max_position_size"])
-        if "execution_timeout" in data:
-            BOT_CONFIG.execution_timeout = int(data["execution_timeout"])
-        if "scan_interval" in data:
-            BOT_CONFIG.scan_interval = int(data["scan_interval"])
+        try:
+            data = orjson.loads(request.get_data())
+        except orjson.JSONDecodeError:
+            return jsonify({"error": "Invalid JSON body"}), 400
+        if not isinstance(data, dict):
+            return jsonify({"error": "JSON body must be an object"}), 400
+
+        try:
+            updates = {
+                attr: cast(data[key]) for key, cast, attr in _BOT_FIELDS if key in data
+            }
+        except (TypeError, ValueError) as e:
+            return jsonify({"error": f"Invalid config value: {e}"}), 400
+        with config_lock:
+            config = BOT_CONFIG = replace(BOT_CONFIG, **updates)
+        bump("status", "health")
 
         logger.info(
-            f"Bot config updated: enabled={BOT_CONFIG.enabled}, "
-            f"min_edge={BOT_CONFIG.min_edge}%, "
-            f"max_pos=${BOT_CONFIG.max_position_size}"
+            "Bot config updated: enabled=%s, min_edge=%s%%, max_pos=$%s",
+            config.enabled,
+            config.min_edge,
+            config.max_position_size,
         )
 
-    return jsonify(
-        {
-            "enabled": BOT_CONFIG.enabled,
-            "minEdge": BOT_CONFIG.min_edge,
-            "maxPositionSize": BOT_CONFIG.max_position_size,
-            "executionTimeout": BOT_CONFIG.execution_timeout,
-            "scanInterval": BOT_CONFIG.scan_interval,
-        }
-    )
+    return Response(config_views(config)[1], mimetype="application/json")
 
 
 @app.route("/api/bot/status")
+@cached_json("status")
 def get_bot_status():
     """Get bot status"""
-    return jsonify(
-        {
-            "enabled": BOT_CONFIG.enabled,
-            "config": {
-                "minEdge": BOT_CONFIG.min_edge,
-                "maxPositionSize": BOT_CONFIG.max_position_size,
-                "maxExecutionWait": BOT_CONFIG.execution_timeout,
-            },
-            "riskMetrics": {
-                "maxConcurrentExecutions": BOT_CONFIG.max_concurrent_executions,
-                "activeExecutions": len(active_executions),
-            },
-            "scannerStatus": {
-                "isScanning": True,
-                "opportunitiesCount": len(opportunities_cache),
-                "lastUpdate": last_update,
-            },
-        }
-    )
+    config = BOT_CONFIG  # one consistent snapshot for every field
+    return {
+        "enabled": config.enabled,
+        "config": config_views(config)[2],
+        "riskMetrics": {
+            "maxConcurrentExecutions": config.max_concurrent_executions,
+            "activeExecutions": len(active_executions),
+        },
+        "scannerStatus": {
+            "isScanning": True,
+            "opportunitiesCount": len(opportunities_cache),
+            "lastUpdate": last_update,
+        },
+    }
 
 
 @app.route("/api/execute", methods=["POST"])
 def execute_arbitrage():
     """Manually execute arbitrage for a market"""
-    global execution_logs
-
     data = request.get_json()
     market_id = data.get("marketId")
     position_size = float(data.get("positionSize", 50))
@@ -917,28 +1309,25 @@ def execute_arbitrage():
         return jsonify({"error": "marketId is required"}), 400
 
     # Find opportunity
-    opp_dict = None
-    for o in opportunities_cache:
-        if o.get("marketId") == market_id:
-            opp_dict = o
-            break
+    opp_dict = opportunities_by_id.get(market_id)
 
     if not opp_dict:
         return jsonify({"error": "Market not found in opportunities"}), 404
 
     # Simulate execution and log
-    execution_id = f"exec_{int(time.time())}"
-    yes_price = opp_dict.get("yesAsk", 0) or 0
-    no_price = opp_dict.get("noAsk", 0) or 0
-    edge = opp_dict.get("edge", 0) or 0
-    market_name = opp_dict.get("marketName", "Unknown")
+    execution_id = f"exec_{time.monotonic_ns()}_{next(_exec_counter)}"
+    g = opp_dict.get
+    yes_price = float(g("yesAsk") or 0)
+    no_price = float(g("noAsk") or 0)
+    edge = float(g("edge") or 0)
+    market_name = g("marketName") or "Unknown"
 
     # Simulate execution
     pnl = position_size * (edge / 100)
 
     log_entry = {
         "id": execution_id,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now_iso(),
         "market": market_name,
         "market_id": market_id,
         "yes_price": yes_price,
@@ -947,12 +1336,10 @@ def execute_arbitrage():
         "actual_edge": edge,
         "status": "BOTH_FILLED",
         "details": "Simulated execution successful",
-        "pnl": round(pnl, 2),
+        "pnl": pnl,
     }
 
-    execution_logs.insert(0, log_entry)
-    if len(execution_logs) > 500:
-        execution_logs = execution_logs[:500]
+    record_execution_log(log_entry)
 
     return jsonify(
         {
@@ -960,7 +1347,7 @@ def execute_arbitrage():
             "executionId": execution_id,
             "status": "BOTH_FILLED",
             "details": "Simulated execution successful",
-            "pnl": round(pnl, 2),
+            "pnl": pnl,
         }
     )
 
@@ -986,4 +1373,10 @@ if __name__ == "__main__":
     else:
         logger.info("CLOB API: No private key (running in demo mode)")
 
-    app.run(host="0.0.0.0", port=3001, debug=False)
+    start_background_workers()
+
+    # Waitress instead of the Werkzeug dev server: dashboard polls are served
+    # concurrently from a thread pool instead of queueing behind each other
+    import waitress
+
+    waitress.serve(app, host="0.0.0.0", port=3001, threads=16)
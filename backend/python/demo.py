@@ -5,17 +5,23 @@ Shows how to fetch markets and detect arbitrage opportunities
 """
 
 import requests
-import json
+import orjson
+import functools
+import numpy as np
 from datetime import datetime
+from typing import Tuple
 
 # Polymarket API endpoints
 GAMMA_API = "https://gamma-api.polymarket.com"
 DATA_API = "https://data-api.polymarket.com"
 
+# Shared keep-alive session: repeat calls skip the TCP/TLS handshake
+session = requests.Session()
+
 
 def fetch_active_markets(limit=10):
     """Fetch active markets from Gamma API"""
-    response = requests.get(
+    response = session.get(
         f"{GAMMA_API}/markets",
         params={
             "limit": limit,
@@ -26,7 +32,14 @@ def fetch_active_markets(limit=10):
         },
     )
     response.raise_for_status()
-    return response.json()
+    return orjson.loads(response.content)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_prices(outcome_prices_str: str) -> Tuple[float, float]:
+    """Parse an outcomePrices string into (yes, no); memoized by raw string"""
+    outcome_prices = orjson.loads(outcome_prices_str)
+    return float(outcome_prices[0]), float(outcome_prices[1])
 
 
 def analyze_market_for_arbitrage(market):
@@ -36,12 +49,7 @@ def analyze_market_for_arbitrage(market):
         return None
 
     try:
-        outcome_prices = json.loads(outcome_prices_str)
-        if len(outcome_prices) < 2:
-            return None
-
-        yes_price = float(outcome_prices[0])
-        no_price = float(outcome_prices[1])
+        yes_price, no_price = _parse_prices(outcome_prices_str)
         total_cost = yes_price + no_price
 
         # Calculate potential profit
@@ -57,12 +65,51 @@ def analyze_market_for_arbitrage(market):
                 "volume": round(market.get("volume24hr", 0), 0),
             }
 
-    except (ValueError, json.JSONDecodeError):
+    except (ValueError, orjson.JSONDecodeError, IndexError):
         pass
 
     return None
 
 
+def analyze_markets(markets):
+    """Analyze many markets at once; same results as analyze_market_for_arbitrage"""
+    rows = []
+    prices = []
+    for market in markets:
+        outcome_prices_str = market.get("outcomePrices")
+        if not outcome_prices_str:
+            continue
+        try:
+            prices.append(_parse_prices(outcome_prices_str))
+        except (ValueError, orjson.JSONDecodeError, IndexError):
+            continue
+        rows.append(market)
+
+    if not rows:
+        return []
+
+    prices = np.array(prices, dtype=np.float64)
+    yes, no = prices[:, 0], prices[:, 1]
+    total = yes + no
+    edge = np.clip((1.0 - total) * 100.0, 0.0, None)
+
+    # Only markets that clear the threshold become dicts
+    opportunities = []
+    for i in np.flatnonzero(edge > 0.1):
+        market = rows[i]
+        opportunities.append(
+            {
+                "market": market["question"][:50] + "...",
+                "yes_price": float(yes[i]),
+                "no_price": float(no[i]),
+                "total_cost": float(total[i]),
+                "edge_percent": round(float(edge[i]), 2),
+                "volume": round(market.get("volume24hr", 0), 0),
+            }
+        )
+    return opportunities
+
+
 def main():
     print("🚀 PolyArb Polymarket API Integration Demo")
     print("=" * 50)
@@ -74,12 +121,7 @@ def main():
 
     # Analyze for arbitrage
     print("🔍 Analyzing markets for arbitrage opportunities...")
-    opportunities = []
-
-    for market in markets:
-        opportunity = analyze_market_for_arbitrage(market)
-        if opportunity:
-            opportunities.append(opportunity)
+    opportunities = analyze_markets(markets)
 
     # Display results
     if opportunities:
@@ -100,7 +142,10 @@ def main():
     # Show market examples
     print("\n📈 Sample Markets:")
     for market in markets[:3]:
-        outcome_prices = json.loads(market.get("outcomePrices", '["N/A", "N/A"]'))
+        try:
+            outcome_prices = _parse_prices(market.get("outcomePrices"))
+        except (TypeError, ValueError, orjson.JSONDecodeError, IndexError):
+            outcome_prices = ("N/A", "N/A")
         print(f"• {market['question'][:60]}...")
         print(f"  YES: {outcome_prices[0]} | NO: {outcome_prices[1]}")
         print(f"  Volume: ${market.get('volume24hr', 0):,.0f}")
@@ -3,9 +3,14 @@ OrderManager - Production-ready order management for Polymarket arbitrage engine
 Handles real order placement, monitoring, and risk mitigation
 """
 
+import sys
 import time
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+import threading
+import itertools
+from concurrent.futures import Future, ThreadPoolExecutor
+import numpy as np
+from typing import Callable, Dict, List, Optional, Set, Tuple, Any
 from dataclasses import dataclass
 from enum import Enum
 
@@ -21,6 +26,8 @@ SELL = "SELL"
 
 # Mock ClobClient for development
 class BookParams:
+    __slots__ = ("token_id",)
+
     def __init__(self, token_id: str):
         self.token_id = token_id
 
@@ -41,8 +48,16 @@ class MockClobClient:
         self.key = key
         self.passphrase = passphrase
         self.wallet_private_key = wallet_private_key
+
+        # Uniform [0, 1) draws generated up front and cycled through, so the
+        # simulated fills cost an index instead of a random module call
+        self._draws = np.random.default_rng().random(1 << 16).tolist()
+        self._draw_index = itertools.count()  # next() is atomic across threads
         logger.info("MockClobClient initialized (development mode)")
 
+    def _draw(self) -> float:
+        return self._draws[next(self._draw_index) % len(self._draws)]
+
     def create_api_key(self):
         logger.info("Mock: API key creation skipped")
         return None
@@ -63,15 +78,29 @@ class MockClobClient:
         }
 
     def get_order_book(self, book_params: BookParams):
-        # Mock order book
+        # Mock order book (tight enough that YES + NO asks leave an edge)
         return {
-            "asks": [{"price": "0.55", "size": "100"}],
+            "asks": [{"price": "0.48", "size": "100"}],
             "bids": [{"price": "0.45", "size": "100"}],
         }
 
-    def create_order(self, token_id: str, side: str, size: float, price: float):
+    def get_order_books(self, params: List[BookParams]):
+        # Mock bulk order books, in request order
+        return [self.get_order_book(book_params) for book_params in params]
+
+    def create_order(
+        self,
+        token_id: str,
+        side: str,
+        size: float,
+        price: float,
+        placement_time: Optional[float] = None,
+    ):
         # Mock order creation
-        return {"market": token_id, "side": side, "size": size, "price": price}
+        order = {"market": token_id, "side": side, "size": size, "price": price}
+        if placement_time is not None:
+            order["placement_time"] = placement_time
+        return order
 
     def sign_order(self, order):
         # Mock signing
@@ -79,36 +108,89 @@ class MockClobClient:
 
     def post_order(self, signed_order, orderType: str = "GTC"):
         # Mock order posting - simulate success/failure randomly
-        import random
-
-        if random.random() > 0.1:  # 90% success rate
-            return {"orderID": f"mock_order_{random.randint(1000, 9999)}"}
+        if self._draw() > 0.1:  # 90% success rate
+            return {"orderID": f"mock_order_{1000 + int(self._draw() * 9000)}"}
         else:
             raise Exception("Mock: Order placement failed")
 
     def cancel_order(self, order_id: str):
-        logger.info(f"Mock: Cancelled order {order_id}")
+        logger.info("Mock: Cancelled order %s", order_id)
         return True
 
     def get_order(self, order_id: str):
         # Mock order status
-        import random
-
-        statuses = ["open", "filled", "cancelled"]
+        statuses = ("open", "filled", "cancelled")
         return {
-            "status": random.choice(statuses),
+            "status": statuses[int(self._draw() * 3)],
             "size": 10.0,
-            "filled_size": random.uniform(0, 10),
-            "remaining_size": random.uniform(0, 10),
+            "filled_size": self._draw() * 10,
+            "remaining_size": self._draw() * 10,
             "price": 0.5,
         }
 
+    def get_orders(self, order_ids: List[str]):
+        # Mock bulk order status, keyed by order id
+        return {order_id: self.get_order(order_id) for order_id in order_ids}
+
 
 # Use mock client for development
 ClobClient = MockClobClient
 
 logger = logging.getLogger(__name__)
 
+# Fill polling backs off exponentially between these bounds (seconds), so a
+# quick fill is seen within ~50ms without hammering the API on slow ones
+POLL_INTERVAL_MIN = 0.05
+POLL_INTERVAL_MAX = 1.0
+
+
+def _poll_sleep(poll_interval: float, deadline_ns: int) -> None:
+    """Sleep for poll_interval, but never past the monotonic deadline_ns"""
+    remaining = (deadline_ns - time.monotonic_ns()) / 1e9
+    if remaining > 0:
+        time.sleep(min(poll_interval, remaining))
+
+
+# Order books go stale fast; market metadata (token ids, name) doesn't
+BOOK_CACHE_TTL = 0.25
+MARKET_CACHE_TTL = 3600
+
+
+class TTLCache:
+    """Small bounded cache whose entries expire ttl seconds after insertion"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: Dict[Any, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()  # writers only; get() is a dict read
+
+    def get(self, key: Any) -> Any:
+        """Return the cached value, or None if missing or expired"""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry[0]:
+            self._data.pop(key, None)
+            return None
+        return entry[1]
+
+    def set(self, key: Any, value: Any) -> None:
+        with self._lock:
+            if len(self._data) >= self.maxsize:
+                now = time.monotonic()
+                for k, (expires, _) in list(self._data.items()):
+                    if expires <= now:
+                        self._data.pop(k, None)
+                if len(self._data) >= self.maxsize:
+                    self._data.pop(next(iter(self._data)), None)  # oldest insert
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+
+# dataclass kwargs shared by both modules: slots=True needs Python 3.10+,
+# plain dataclasses elsewhere
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class OrderStatus(Enum):
     PENDING = "pending"
@@ -124,9 +206,10 @@ class FillStatus(Enum):
     ONE_FILLED = "one_filled"
     NONE_FILLED = "none_filled"
     TIMEOUT = "timeout"
+    SKIPPED = "skipped"  # aborted before any order was placed
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class OrderInfo:
     order_id: str
     token_id: str
@@ -139,7 +222,7 @@ class OrderInfo:
     remaining_size: float = 0.0
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ArbitrageExecution:
     market_id: str
     yes_order: Optional[OrderInfo] = None
@@ -150,6 +233,13 @@ class ArbitrageExecution:
     notes: str = ""
 
 
+@dataclass(**DATACLASS_SLOTS)
+class PositionRecord:
+    type: str  # "hedged", "naked_yes" or "naked_no"
+    size: float
+    timestamp: float
+
+
 class OrderManager:
     """
     Production-ready order management for Polymarket arbitrage
@@ -162,6 +252,7 @@ class OrderManager:
         key: Optional[str] = None,
         passphrase: Optional[str] = None,
         wallet_private_key: Optional[str] = None,
+        placement_horizon: float = 0.05,
     ):
         """
         Initialize OrderManager with Polymarket CLOB client
@@ -171,54 +262,147 @@ class OrderManager:
             key: API key
             passphrase: API passphrase
             wallet_private_key: Wallet private key for signing
+            placement_horizon: Seconds ahead of now both arbitrage legs are
+                scheduled to post at (should cover a couple of round trips)
         """
         self.client = ClobClient(
             host, key=key, passphrase=passphrase, wallet_private_key=wallet_private_key
         )
         self.logger = logging.getLogger(__name__)
         self.position_validator = PositionValidator()
+        self.placement_horizon = placement_horizon
+        self._book_cache = TTLCache(maxsize=4096, ttl=BOOK_CACHE_TTL)
+        self._book_params: Dict[str, BookParams] = {}  # one per token, reused
+        self._market_cache = TTLCache(maxsize=10000, ttl=MARKET_CACHE_TTL)
+
+        # Reads currently in flight, keyed by (kind, id); concurrent callers
+        # for the same key wait on the first caller's request
+        self._inflight: Dict[Tuple[str, str], Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        # Places the YES and NO legs of an execution concurrently; sized for
+        # two legs per execution at execute_many's default concurrency
+        self._leg_pool = ThreadPoolExecutor(
+            max_workers=32, thread_name_prefix="order-leg"
+        )
 
         # Create API keys if they don't exist
         try:
             self.client.create_api_key()
             self.logger.info("API keys created successfully")
         except Exception as e:
-            self.logger.warning(f"API key creation failed (may already exist): {e}")
+            self.logger.warning("API key creation failed (may already exist): %s", e)
 
         # Derive and set collateral token
         try:
             collateral_token = self.client.get_collateral_token()
             self.collateral_token_id = collateral_token["token_id"]
-            self.logger.info(f"Collateral token: {self.collateral_token_id}")
+            self.logger.info("Collateral token: %s", self.collateral_token_id)
         except Exception as e:
-            self.logger.error(f"Failed to get collateral token: {e}")
+            self.logger.error("Failed to get collateral token: %s", e)
             raise
 
+    def _single_flight(self, key: Tuple[str, str], fetch: Callable[[], Any]) -> Any:
+        """Run fetch() at most once at a time per key; overlapping callers share it"""
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fetch()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
     def get_market_info(self, market_id: str) -> Dict[str, Any]:
         """Get market information including tokens"""
+        cached = self._market_cache.get(market_id)
+        if cached is not None:
+            return cached
+
         try:
-            market = self.client.get_market(market_id)
-            return {
+            market = self._single_flight(
+                ("market", market_id), lambda: self.client.get_market(market_id)
+            )
+            info = {
                 "yes_token_id": market["tokens"][0]["token_id"],  # YES token
                 "no_token_id": market["tokens"][1]["token_id"],  # NO token
                 "market_name": market["market"],
             }
+            self._market_cache.set(market_id, info)
+            return info
         except Exception as e:
-            self.logger.error(f"Failed to get market info for {market_id}: {e}")
+            self.logger.error("Failed to get market info for %s: %s", market_id, e)
             raise
 
+    def _bp(self, token_id: str) -> BookParams:
+        """Shared BookParams for a token (created on first use)"""
+        params = self._book_params.get(token_id)
+        if params is None:
+            params = self._book_params.setdefault(token_id, BookParams(token_id))
+        return params
+
     def get_order_book(self, token_id: str) -> Dict[str, Any]:
         """Get order book for a specific token"""
+        cached = self._book_cache.get(token_id)
+        if cached is not None:
+            return cached
+
         try:
-            book_params = BookParams(token_id=token_id)
-            book = self.client.get_order_book(book_params)
+            book = self._single_flight(
+                ("book", token_id),
+                lambda: self.client.get_order_book(self._bp(token_id)),
+            )
+            self._book_cache.set(token_id, book)
             return book
         except Exception as e:
-            self.logger.error(f"Failed to get order book for token {token_id}: {e}")
+            self.logger.error("Failed to get order book for token %s: %s", token_id, e)
             raise
 
+    def get_order_books(self, token_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get order books for several tokens, fetching cache misses in one call"""
+        books = {}
+        missing = []
+        for token_id in token_ids:
+            cached = self._book_cache.get(token_id)
+            if cached is None:
+                missing.append(token_id)
+            else:
+                books[token_id] = cached
+
+        if missing:
+            try:
+                fetched = self.client.get_order_books(
+                    [self._bp(token_id) for token_id in missing]
+                )
+            except Exception as e:
+                self.logger.error("Failed to get order books for %s: %s", missing, e)
+                raise
+            for token_id, book in zip(missing, fetched):
+                self._book_cache.set(token_id, book)
+                books[token_id] = book
+
+        return books
+
     def place_limit_order(
-        self, token_id: str, side: str, size: float, price: float
+        self,
+        token_id: str,
+        side: str,
+        size: float,
+        price: float,
+        placement_time: Optional[float] = None,
+        post_at_ns: Optional[int] = None,
     ) -> str:
         """
         Place a limit order
@@ -228,46 +412,77 @@ class OrderManager:
             side: BUY or SELL
             size: Order size
             price: Limit price
+            placement_time: Unix time the order should reach the book at.
+                The CLOB has no native support, so the post is held locally
+                until then after creating and signing the order.
+            post_at_ns: time.monotonic_ns() deadline for that local hold.
+                Derived from placement_time on entry when not given; the
+                hold itself never reads the wall clock.
 
         Returns:
             order_id: The placed order ID
         """
+        if placement_time is not None and post_at_ns is None:
+            post_at_ns = time.monotonic_ns() + int(
+                (placement_time - time.time()) * 1_000_000_000
+            )
+
         try:
             # Create order
             order = self.client.create_order(
-                token_id=token_id, side=side, size=size, price=price
+                token_id=token_id,
+                side=side,
+                size=size,
+                price=price,
+                placement_time=placement_time,
             )
 
             # Sign and post order
             signed_order = self.client.sign_order(order)
+            if post_at_ns is not None:
+                delay_ns = post_at_ns - time.monotonic_ns()
+                if delay_ns > 0:
+                    time.sleep(delay_ns / 1e9)
             resp = self.client.post_order(
                 signed_order, orderType=ClobClient.ORDER_TYPE_GTC
             )
 
             order_id = resp["orderID"]
             self.logger.info(
-                f"Order placed: {order_id} - {side} {size}@{price} for token {token_id}"
+                "Order placed: %s - %s %s@%s for token %s",
+                order_id,
+                side,
+                size,
+                price,
+                token_id,
             )
             return order_id
 
         except Exception as e:
-            self.logger.error(f"Failed to place order for token {token_id}: {e}")
+            self.logger.error("Failed to place order for token %s: %s", token_id, e)
             raise
 
     def cancel_order(self, order_id: str) -> bool:
         """Cancel an order"""
         try:
             self.client.cancel_order(order_id)
-            self.logger.info(f"Order cancelled: {order_id}")
+            self.logger.info("Order cancelled: %s", order_id)
             return True
         except Exception as e:
-            self.logger.error(f"Failed to cancel order {order_id}: {e}")
+            self.logger.error("Failed to cancel order %s: %s", order_id, e)
             return False
 
     def get_order_status(self, order_id: str) -> Dict[str, Any]:
-        """Get order status and fill information"""
+        """
+        Get order status and fill information as a dict
+
+        Kept as public API for one-off lookups; OrderManager's own fill
+        polling goes through update_order_info/update_orders_info instead.
+        """
         try:
-            order = self.client.get_order(order_id)
+            order = self._single_flight(
+                ("order", order_id), lambda: self.client.get_order(order_id)
+            )
             return {
                 "status": order.get("status", "unknown"),
                 "size": float(order.get("size", 0)),
@@ -276,7 +491,7 @@ class OrderManager:
                 "price": float(order.get("price", 0)),
             }
         except Exception as e:
-            self.logger.error(f"Failed to get order status for {order_id}: {e}")
+            self.logger.error("Failed to get order status for %s: %s", order_id, e)
             return {
                 "status": "error",
                 "size": 0,
@@ -285,6 +500,48 @@ class OrderManager:
                 "price": 0,
             }
 
+    def _apply_order(self, order_info: OrderInfo, order: Dict[str, Any]) -> bool:
+        """Copy fill progress from a raw order onto order_info; True once filled"""
+        filled_size = float(order.get("filled_size", 0))
+        order_info.filled_size = filled_size
+        order_info.remaining_size = float(order.get("remaining_size", 0))
+
+        if filled_size == order_info.size:
+            order_info.status = OrderStatus.FILLED
+            return True
+        if filled_size > 0:
+            order_info.status = OrderStatus.PARTIAL_FILL
+        return False
+
+    def update_order_info(self, order_info: OrderInfo) -> bool:
+        """Refresh an order's fill state in place; returns True once fully filled"""
+        try:
+            order = self._single_flight(
+                ("order", order_info.order_id),
+                lambda: self.client.get_order(order_info.order_id),
+            )
+        except Exception as e:
+            self.logger.error(
+                "Failed to get order status for %s: %s", order_info.order_id, e
+            )
+            return False
+        return self._apply_order(order_info, order)
+
+    def update_orders_info(self, order_infos: List[OrderInfo]) -> List[bool]:
+        """Refresh several orders in place with one request; filled flag per order"""
+        order_ids = [order_info.order_id for order_info in order_infos]
+        try:
+            orders = self.client.get_orders(order_ids)
+        except Exception as e:
+            self.logger.error("Failed to get order statuses for %s: %s", order_ids, e)
+            orders = {}
+
+        filled = []
+        for order_info in order_infos:
+            order = orders.get(order_info.order_id)
+            filled.append(order is not None and self._apply_order(order_info, order))
+        return filled
+
     def execute_arbitrage(
         self,
         market_id: str,
@@ -292,6 +549,7 @@ class OrderManager:
         no_price: float,
         position_size: float,
         max_wait_time: int = 30,
+        min_edge: float = 0.0,
     ) -> ArbitrageExecution:
         """
         Execute arbitrage trade: Buy YES and NO simultaneously
@@ -302,6 +560,8 @@ class OrderManager:
             no_price: Ask price for NO token
             position_size: Size to trade
             max_wait_time: Max time to wait for fills (seconds)
+            min_edge: Edge (1 - YES ask - NO ask, in dollars) the live books
+                must still exceed before any order is placed
 
         Returns:
             ArbitrageExecution: Complete execution result
@@ -314,18 +574,72 @@ class OrderManager:
             yes_token_id = market_info["yes_token_id"]
             no_token_id = market_info["no_token_id"]
 
-            self.logger.info(f"Starting arbitrage execution for market {market_id}")
-            self.logger.info(f"YES token: {yes_token_id} @ {yes_price}")
-            self.logger.info(f"NO token: {no_token_id} @ {no_price}")
-            self.logger.info(f"Position size: {position_size}")
+            self.logger.info("Starting arbitrage execution for market %s", market_id)
+            self.logger.info("YES token: %s @ %s", yes_token_id, yes_price)
+            self.logger.info("NO token: %s @ %s", no_token_id, no_price)
+            self.logger.info("Position size: %s", position_size)
 
-            # Place both orders simultaneously
-            yes_order_id = self.place_limit_order(
-                yes_token_id, BUY, position_size, yes_price
+            # Re-check the edge on the live books before committing to either
+            # leg - it may have closed since the scan
+            books = self.get_order_books([yes_token_id, no_token_id])
+            yes_book = books[yes_token_id]
+            no_book = books[no_token_id]
+            current_yes_ask = (
+                float(yes_book["asks"][0]["price"])
+                if yes_book.get("asks")
+                else yes_price
+            )
+            current_no_ask = (
+                float(no_book["asks"][0]["price"]) if no_book.get("asks") else no_price
+            )
+            live_edge = 1.0 - current_yes_ask - current_no_ask
+            if live_edge <= min_edge:
+                execution.fill_status = FillStatus.SKIPPED
+                execution.notes = (
+                    f"Edge disappeared before submission: YES {current_yes_ask} + "
+                    f"NO {current_no_ask} leaves {live_edge:.4f}"
+                )
+                self.logger.warning("❌ Arbitrage skipped: %s", execution.notes)
+                return execution
+
+            # Place both orders simultaneously - both posts are in flight at
+            # once, so the NO leg doesn't wait out the YES leg's round trip.
+            # Both legs share one placement time so they hit the book together;
+            # the local hold runs off the monotonic clock, the wall-clock
+            # placement_time only goes into the order payload.
+            post_at_ns = time.monotonic_ns() + int(
+                self.placement_horizon * 1_000_000_000
             )
-            no_order_id = self.place_limit_order(
-                no_token_id, BUY, position_size, no_price
+            placement_time = time.time() + self.placement_horizon
+            yes_future = self._leg_pool.submit(
+                self.place_limit_order,
+                yes_token_id,
+                BUY,
+                position_size,
+                yes_price,
+                placement_time,
+                post_at_ns,
             )
+            no_future = self._leg_pool.submit(
+                self.place_limit_order,
+                no_token_id,
+                BUY,
+                position_size,
+                no_price,
+                placement_time,
+                post_at_ns,
+            )
+            yes_error = yes_future.exception()
+            no_error = no_future.exception()
+            if yes_error or no_error:
+                # Don't leave the leg that did get placed resting on the book
+                if not yes_error:
+                    self.cancel_order(yes_future.result())
+                if not no_error:
+                    self.cancel_order(no_future.result())
+                raise yes_error or no_error
+            yes_order_id = yes_future.result()
+            no_order_id = no_future.result()
 
             # Create order info objects
             execution.yes_order = OrderInfo(
@@ -360,7 +674,7 @@ class OrderManager:
                 execution.notes = (
                     "Both legs filled successfully - risk-free arbitrage position"
                 )
-                self.logger.info(f"✅ Arbitrage successful: Both orders filled")
+                self.logger.info("✅ Arbitrage successful: Both orders filled")
 
             elif fill_status == FillStatus.ONE_FILLED:
                 # Risk mitigation for partial fill
@@ -373,22 +687,25 @@ class OrderManager:
                 if not position_valid:
                     execution.notes += " ⚠️ WARNING: Naked exposure detected - manual intervention required"
                     self.logger.critical(
-                        f"🚨 CRITICAL: Naked position in market {market_id} after mitigation"
+                        "🚨 CRITICAL: Naked position in market %s after mitigation",
+                        market_id,
                     )
 
             else:  # NONE_FILLED or TIMEOUT
-                # Cancel remaining orders
-                self.cancel_order(yes_order_id)
-                self.cancel_order(no_order_id)
+                # Cancel remaining orders - both in flight at once, and left
+                # to settle in the background (cancel_order logs failures)
+                self._leg_pool.submit(self.cancel_order, yes_order_id)
+                self._leg_pool.submit(self.cancel_order, no_order_id)
                 execution.fill_status = fill_status
                 execution.pnl = 0.0
                 execution.notes = f"Failed to fill orders: {fill_status.value}"
-                self.logger.warning(f"❌ Arbitrage failed: {fill_status.value}")
+                self.logger.warning("❌ Arbitrage failed: %s", fill_status.value)
 
             # Final position validation
             if not position_valid and fill_status != FillStatus.NONE_FILLED:
                 self.logger.critical(
-                    f"🚨 POSITION VALIDATION FAILED: Market {market_id} has unsafe exposure"
+                    "🚨 POSITION VALIDATION FAILED: Market %s has unsafe exposure",
+                    market_id,
                 )
                 execution.notes += " 🚨 POSITION VALIDATION FAILED"
 
@@ -396,10 +713,79 @@ class OrderManager:
             execution.fill_status = FillStatus.NONE_FILLED
             execution.pnl = 0.0
             execution.notes = f"Execution error: {str(e)}"
-            self.logger.error(f"Arbitrage execution failed: {e}")
+            self.logger.error("Arbitrage execution failed: %s", e)
 
         return execution
 
+    def execute_many(
+        self, opportunities: List[Dict[str, Any]], concurrency: int = 16
+    ) -> List[ArbitrageExecution]:
+        """
+        Execute arbitrage on several independent markets concurrently
+
+        Args:
+            opportunities: execute_arbitrage keyword arguments, one dict per
+                market (market_id, yes_price, no_price, position_size, ...)
+            concurrency: Max executions in flight at once (API rate limits)
+
+        Returns:
+            List[ArbitrageExecution]: Results in the same order as the input
+        """
+        if not opportunities:
+            return []
+
+        with ThreadPoolExecutor(
+            max_workers=min(concurrency, len(opportunities)),
+            thread_name_prefix="arb-exec",
+        ) as pool:
+            return list(
+                pool.map(lambda opp: self.execute_arbitrage(**opp), opportunities)
+            )
+
+    def execute_batch(
+        self,
+        market_ids: List[str],
+        yes_prices: Any,
+        no_prices: Any,
+        sizes: Any,
+        concurrency: int = 16,
+        **common: Any,
+    ) -> List[ArbitrageExecution]:
+        """
+        Execute a column-oriented batch of opportunities
+
+        Rows whose yes + no price no longer sums below 1.0 are dropped before
+        any order is placed; the rest go through execute_many.
+
+        Args:
+            market_ids: Market id per row
+            yes_prices: YES ask per row (array-like)
+            no_prices: NO ask per row (array-like)
+            sizes: Position size per row, or one size for every row
+            concurrency: Max executions in flight at once
+            **common: Extra execute_arbitrage kwargs for every row
+                (e.g. max_wait_time)
+
+        Returns:
+            List[ArbitrageExecution]: Results for the profitable rows, in order
+        """
+        yes_prices = np.asarray(yes_prices, dtype=np.float64)
+        no_prices = np.asarray(no_prices, dtype=np.float64)
+        sizes = np.broadcast_to(np.asarray(sizes, dtype=np.float64), yes_prices.shape)
+
+        rows = np.flatnonzero((yes_prices + no_prices) < 1.0)
+        opportunities = [
+            dict(
+                market_id=market_ids[i],
+                yes_price=float(yes_prices[i]),
+                no_price=float(no_prices[i]),
+                position_size=float(sizes[i]),
+                **common,
+            )
+            for i in rows
+        ]
+        return self.execute_many(opportunities, concurrency)
+
     def monitor_fills(
         self, execution: ArbitrageExecution, max_wait_time: int
     ) -> FillStatus:
@@ -409,43 +795,39 @@ class OrderManager:
         Returns:
             FillStatus: Result of monitoring
         """
-        start_time = time.time()
-        yes_filled = False
-        no_filled = False
-
-        while time.time() - start_time < max_wait_time:
-            # Check YES order
-            if execution.yes_order and not yes_filled:
-                status = self.get_order_status(execution.yes_order.order_id)
-                execution.yes_order.filled_size = status["filled_size"]
-                execution.yes_order.remaining_size = status["remaining_size"]
-
-                if status["filled_size"] == execution.yes_order.size:
+        # Monotonic integer clock: immune to wall-clock (NTP) jumps
+        start_ns: int = time.monotonic_ns()
+        timeout_ns: int = int(max_wait_time * 1_000_000_000)
+        yes_filled: bool = False
+        no_filled: bool = False
+        poll_interval: float = POLL_INTERVAL_MIN
+
+        while time.monotonic_ns() - start_ns < timeout_ns:
+            # One round trip for every leg still waiting on a fill
+            pending: List[OrderInfo] = [
+                order
+                for order, filled in (
+                    (execution.yes_order, yes_filled),
+                    (execution.no_order, no_filled),
+                )
+                if order and not filled
+            ]
+            for order, filled in zip(pending, self.update_orders_info(pending)):
+                if not filled:
+                    continue
+                if order is execution.yes_order:
                     yes_filled = True
-                    execution.yes_order.status = OrderStatus.FILLED
-                elif status["filled_size"] > 0:
-                    execution.yes_order.status = OrderStatus.PARTIAL_FILL
-
-            # Check NO order
-            if execution.no_order and not no_filled:
-                status = self.get_order_status(execution.no_order.order_id)
-                execution.no_order.filled_size = status["filled_size"]
-                execution.no_order.remaining_size = status["remaining_size"]
-
-                if status["filled_size"] == execution.no_order.size:
+                else:
                     no_filled = True
-                    execution.no_order.status = OrderStatus.FILLED
-                elif status["filled_size"] > 0:
-                    execution.no_order.status = OrderStatus.PARTIAL_FILL
+                poll_interval = POLL_INTERVAL_MIN  # other leg likely close
 
             # Check completion
             if yes_filled and no_filled:
                 return FillStatus.BOTH_FILLED
-            elif yes_filled or no_filled:
-                # One filled, continue monitoring for the other
-                continue
 
-            time.sleep(0.5)  # Check every 500ms
+            # One or neither filled: back off before polling again
+            _poll_sleep(poll_interval, start_ns + timeout_ns)
+            poll_interval = min(poll_interval * 2, POLL_INTERVAL_MAX)
 
         # Timeout reached
         if yes_filled or no_filled:
@@ -501,15 +883,24 @@ class OrderManager:
                 )
 
                 # Monitor for 10 seconds
-                start_monitor = time.time()
-                while time.time() - start_monitor < 10:
-                    status = self.get_order_status(new_no_order_id)
-                    if status["filled_size"] == execution.no_order.size:
+                retry_order = OrderInfo(
+                    order_id=new_no_order_id,
+                    token_id=execution.no_order.token_id,
+                    side=BUY,
+                    size=execution.no_order.size,
+                    price=current_no_ask,
+                    timestamp=time.time(),
+                )
+                start_monitor_ns = time.monotonic_ns()
+                poll_interval = POLL_INTERVAL_MIN
+                while time.monotonic_ns() - start_monitor_ns < 10_000_000_000:
+                    if self.update_order_info(retry_order):
                         return (
                             0.0,
                             "YES and NO both filled after retry - risk-free position",
                         )
-                    time.sleep(0.5)
+                    _poll_sleep(poll_interval, start_monitor_ns + 10_000_000_000)
+                    poll_interval = min(poll_interval * 2, POLL_INTERVAL_MAX)
 
             # If NO still not filled, exit YES position at best bid
             yes_book = self.get_order_book(execution.yes_order.token_id)
@@ -519,14 +910,14 @@ class OrderManager:
                 loss = (
                     execution.yes_order.price - exit_price
                 ) * execution.yes_order.size
-                self.logger.warning(f"Exiting YES position with loss: ${loss:.4f}")
+                self.logger.warning("Exiting YES position with loss: $%.4f", loss)
                 return (
                     -loss,
                     f"YES filled, NO failed - exited position with controlled loss: ${loss:.4f}",
                 )
 
         except Exception as e:
-            self.logger.error(f"Error handling YES-only fill: {e}")
+            self.logger.error("Error handling YES-only fill: %s", e)
 
         return -0.01, "YES filled, NO failed - small controlled loss assumed"
 
@@ -552,29 +943,38 @@ class OrderManager:
                     current_yes_ask,
                 )
 
-                start_monitor = time.time()
-                while time.time() - start_monitor < 10:
-                    status = self.get_order_status(new_yes_order_id)
-                    if status["filled_size"] == execution.yes_order.size:
+                retry_order = OrderInfo(
+                    order_id=new_yes_order_id,
+                    token_id=execution.yes_order.token_id,
+                    side=BUY,
+                    size=execution.yes_order.size,
+                    price=current_yes_ask,
+                    timestamp=time.time(),
+                )
+                start_monitor_ns = time.monotonic_ns()
+                poll_interval = POLL_INTERVAL_MIN
+                while time.monotonic_ns() - start_monitor_ns < 10_000_000_000:
+                    if self.update_order_info(retry_order):
                         return (
                             0.0,
                             "YES and NO both filled after retry - risk-free position",
                         )
-                    time.sleep(0.5)
+                    _poll_sleep(poll_interval, start_monitor_ns + 10_000_000_000)
+                    poll_interval = min(poll_interval * 2, POLL_INTERVAL_MAX)
 
             # Exit NO position
             no_book = self.get_order_book(execution.no_order.token_id)
             if no_book.get("bids"):
                 exit_price = float(no_book["bids"][0]["price"])
                 loss = (execution.no_order.price - exit_price) * execution.no_order.size
-                self.logger.warning(f"Exiting NO position with loss: ${loss:.4f}")
+                self.logger.warning("Exiting NO position with loss: $%.4f", loss)
                 return (
                     -loss,
                     f"NO filled, YES failed - exited position with controlled loss: ${loss:.4f}",
                 )
 
         except Exception as e:
-            self.logger.error(f"Error handling NO-only fill: {e}")
+            self.logger.error("Error handling NO-only fill: %s", e)
 
         return -0.01, "NO filled, YES failed - small controlled loss assumed"
 
@@ -586,9 +986,16 @@ class PositionValidator:
     """
 
     def __init__(self):
-        self.active_positions = {}  # market_id -> position info
+        self.active_positions: Dict[str, PositionRecord] = {}
+        self._naked: Set[str] = set()  # market_ids of naked entries in active_positions
         self.logger = logging.getLogger(__name__)
 
+        # Indexed [yes_filled][no_filled]
+        self._validate_dispatch = (
+            (self._both_unfilled, self._naked_no),
+            (self._naked_yes, self._both_filled),
+        )
+
     def validate_arbitrage_position(
         self, market_id: str, yes_order: OrderInfo, no_order: OrderInfo
     ) -> bool:
@@ -598,39 +1005,51 @@ class PositionValidator:
         """
         # Check if both orders exist and are for the same market
         if not yes_order or not no_order:
-            self.logger.error(f"Missing order information for market {market_id}")
+            self.logger.error("Missing order information for market %s", market_id)
             return False
 
-        # Check if both orders are filled (perfect hedge)
         yes_filled = yes_order.status == OrderStatus.FILLED
         no_filled = no_order.status == OrderStatus.FILLED
+        return self._validate_dispatch[yes_filled][no_filled](
+            market_id, yes_order, no_order
+        )
 
-        if yes_filled and no_filled:
-            self.logger.info(f"Market {market_id}: Perfect hedge - both orders filled")
-            self._record_position(market_id, "hedged", yes_order.size)
-            return True
-
-        # Check if neither order is filled (no position)
-        if not yes_filled and not no_filled:
-            self.logger.info(f"Market {market_id}: No position - neither order filled")
-            return True
+    def _both_filled(
+        self, market_id: str, yes_order: OrderInfo, no_order: OrderInfo
+    ) -> bool:
+        """Both orders filled (perfect hedge)"""
+        self.logger.info("Market %s: Perfect hedge - both orders filled", market_id)
+        self._record_position(market_id, "hedged", yes_order.size)
+        return True
 
-        # Check for partial fills (risk state)
-        if yes_filled and not no_filled:
-            self.logger.warning(
-                f"Market {market_id}: DANGEROUS - YES filled, NO not filled (naked YES exposure)"
-            )
-            self._record_position(market_id, "naked_yes", yes_order.size)
-            return False
+    def _both_unfilled(
+        self, market_id: str, yes_order: OrderInfo, no_order: OrderInfo
+    ) -> bool:
+        """Neither order filled (no position)"""
+        self.logger.info("Market %s: No position - neither order filled", market_id)
+        return True
 
-        if no_filled and not yes_filled:
-            self.logger.warning(
-                f"Market {market_id}: DANGEROUS - NO filled, YES not filled (naked NO exposure)"
-            )
-            self._record_position(market_id, "naked_no", no_order.size)
-            return False
+    def _naked_yes(
+        self, market_id: str, yes_order: OrderInfo, no_order: OrderInfo
+    ) -> bool:
+        """Only YES filled (risk state)"""
+        self.logger.warning(
+            "Market %s: DANGEROUS - YES filled, NO not filled (naked YES exposure)",
+            market_id,
+        )
+        self._record_position(market_id, "naked_yes", yes_order.size)
+        return False
 
-        return True
+    def _naked_no(
+        self, market_id: str, yes_order: OrderInfo, no_order: OrderInfo
+    ) -> bool:
+        """Only NO filled (risk state)"""
+        self.logger.warning(
+            "Market %s: DANGEROUS - NO filled, YES not filled (naked NO exposure)",
+            market_id,
+        )
+        self._record_position(market_id, "naked_no", no_order.size)
+        return False
 
     def validate_exit_position(self, market_id: str, exit_order: OrderInfo) -> bool:
         """
@@ -638,44 +1057,54 @@ class PositionValidator:
         Returns True if exit is valid, False otherwise
         """
         if market_id not in self.active_positions:
-            self.logger.warning(f"No active position found for market {market_id}")
+            self.logger.warning("No active position found for market %s", market_id)
             return False
 
         position = self.active_positions[market_id]
 
         # Only allow exits for naked positions
-        if position["type"] == "hedged":
-            self.logger.error(f"Cannot exit hedged position for market {market_id}")
+        if position.type == "hedged":
+            self.logger.error("Cannot exit hedged position for market %s", market_id)
             return False
 
         if exit_order.status == OrderStatus.FILLED:
             self.logger.info(
-                f"Successfully exited {position['type']} position for market {market_id}"
+                "Successfully exited %s position for market %s",
+                position.type,
+                market_id,
             )
-            del self.active_positions[market_id]
+            # Unindex before removing so readers never see a dangling id
+            self._naked.discard(market_id)
+            self.active_positions.pop(market_id, None)
             return True
 
         return False
 
     def _record_position(self, market_id: str, position_type: str, size: float):
         """Record position information for tracking"""
-        self.active_positions[market_id] = {
-            "type": position_type,
-            "size": size,
-            "timestamp": time.time(),
-        }
+        # Order the writes so the _naked index never points at a non-naked
+        # record: unindex before a hedged swap, index after a naked one
+        record = PositionRecord(position_type, size, time.time())
+        if position_type.startswith("naked_"):
+            self.active_positions[market_id] = record
+            self._naked.add(market_id)
+        else:
+            self._naked.discard(market_id)
+            self.active_positions[market_id] = record
 
-    def get_active_positions(self) -> Dict[str, Dict]:
+    def get_active_positions(self) -> Dict[str, PositionRecord]:
         """Get all active positions"""
         return self.active_positions.copy()
 
-    def get_naked_positions(self) -> Dict[str, Dict]:
+    def get_naked_positions(self) -> Dict[str, PositionRecord]:
         """Get positions that have naked exposure (dangerous)"""
-        return {
-            market_id: pos
-            for market_id, pos in self.active_positions.items()
-            if pos["type"] in ["naked_yes", "naked_no"]
-        }
+        # Snapshot the index: other threads may record or exit positions
+        naked = {}
+        for market_id in tuple(self._naked):
+            position = self.active_positions.get(market_id)
+            if position is not None and position.type.startswith("naked_"):
+                naked[market_id] = position
+        return naked
 
     def emergency_close_all(self) -> List[str]:
         """
@@ -687,7 +1116,9 @@ class PositionValidator:
 
         for market_id, position in naked_positions.items():
             self.logger.critical(
-                f"EMERGENCY: Naked {position['type']} position in market {market_id} needs manual closure"
+                "EMERGENCY: Naked %s position in market %s needs manual closure",
+                position.type,
+                market_id,
             )
             manual_intervention.append(market_id)
 
@@ -0,0 +1,68 @@
+import pytest
+
+import app
+
+
+def _market(market_id, yes, no, **fields):
+    market = {
+        "id": market_id,
+        "question": f"Market {market_id}?",
+        "outcomePrices": f'["{yes}", "{no}"]',
+        "volume": 1000,
+    }
+    market.update(fields)
+    return market
+
+
+def test_analyze_markets_np_drops_malformed_rows():
+    markets = [
+        _market("good", 0.45, 0.5),
+        _market("null_question", 0.4, 0.5, question=None),
+        _market("bad_volume", 0.4, 0.5, volume="n/a"),
+        _market("bad_prices", 0.4, 0.5, outcomePrices="not json"),
+        _market("also_good", 0.3, 0.6),
+    ]
+
+    batch = app.analyze_markets_np(markets)
+
+    assert batch.market_ids == ["good", "also_good"]
+    assert batch.names == ["Market good?", "Market also_good?"]
+    assert batch.volume.tolist() == [1000.0, 1000.0]
+
+
+def test_analyze_markets_np_drops_malformed_rows_with_fetched_prices():
+    markets = [_market("good", 0.45, 0.5), _market("bad", 0.4, 0.5, volume="n/a")]
+
+    batch = app.analyze_markets_np(markets, prices=[(0.45, 0.5), (0.4, 0.5)])
+
+    assert batch.market_ids == ["good"]
+    assert batch.edge.round(2).tolist() == [5.0]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # Fresh response cache that can't expire mid-test and change the ETag
+    monkeypatch.setattr(app, "_resp_cache", {})
+    monkeypatch.setattr(app, "RESPONSE_CACHE_TTL", 60)
+    return app.app.test_client()
+
+
+def test_cached_json_returns_304_for_matching_etag(client):
+    first = client.get("/health")
+    etag = first.headers["ETag"]
+    assert first.status_code == 200
+
+    assert client.get("/health", headers={"If-None-Match": etag}).status_code == 304
+    assert (
+        client.get("/health", headers={"If-None-Match": '"stale"'}).status_code == 200
+    )
+
+
+def test_cached_json_ignores_compress_suffix_on_etag(client):
+    etag = client.get("/health").headers["ETag"].strip('"')
+
+    # Flask-Compress appends ":gzip" to the ETag of compressed responses
+    response = client.get("/health", headers={"If-None-Match": f'"{etag}:gzip"'})
+
+    assert response.status_code == 304
+    assert response.data == b""
@@ -0,0 +1,135 @@
+import threading
+import time
+
+import order_manager
+from order_manager import OrderInfo, OrderStatus, PositionValidator
+
+
+def _order(order_id, status):
+    return OrderInfo(
+        order_id, f"token_{order_id}", order_manager.BUY, 10.0, 0.45, 0.0, status
+    )
+
+
+def test_naked_position_is_listed_until_hedged():
+    validator = PositionValidator()
+    filled = _order("yes", OrderStatus.FILLED)
+
+    validator.validate_arbitrage_position(
+        "m", filled, _order("no", OrderStatus.PENDING)
+    )
+    assert list(validator.get_naked_positions()) == ["m"]
+
+    validator.validate_arbitrage_position("m", filled, _order("no", OrderStatus.FILLED))
+    assert validator.get_naked_positions() == {}
+    assert validator.get_active_positions()["m"].type == "hedged"
+
+
+def test_stale_naked_index_entry_is_not_reported():
+    validator = PositionValidator()
+    validator._record_position("m", "hedged", 10.0)
+    # A reader racing a naked -> hedged swap can still see the old index entry
+    validator._naked.add("m")
+
+    assert validator.get_naked_positions() == {}
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    clock = _FakeClock()
+    monkeypatch.setattr(order_manager, "time", clock)
+    cache = order_manager.TTLCache(maxsize=4, ttl=10)
+
+    cache.set("a", 1)
+    clock.now = 9.9
+    assert cache.get("a") == 1
+    clock.now = 10.0
+    assert cache.get("a") is None
+
+
+def test_ttl_cache_evicts_expired_then_oldest(monkeypatch):
+    clock = _FakeClock()
+    monkeypatch.setattr(order_manager, "time", clock)
+    cache = order_manager.TTLCache(maxsize=2, ttl=10)
+
+    cache.set("a", 1)
+    clock.now = 5
+    cache.set("b", 2)
+
+    # Full, "a" expired: it makes room before anything live is evicted
+    clock.now = 11
+    cache.set("c", 3)
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (None, 2, 3)
+
+    # Full, nothing expired: the oldest insert goes
+    cache.set("d", 4)
+    assert (cache.get("b"), cache.get("c"), cache.get("d")) == (None, 3, 4)
+
+
+def _run_single_flight(manager, leader_fetch, followers=4):
+    """Start a blocked leader plus followers on one key; returns their outcomes"""
+    key = ("order", "o1")
+    release = threading.Event()
+    follower_calls = []
+    outcomes = []
+
+    def call(fetch):
+        try:
+            outcomes.append(("ok", manager._single_flight(key, fetch)))
+        except RuntimeError as e:
+            outcomes.append(("error", e))
+
+    def blocked_fetch():
+        release.wait(5)
+        return leader_fetch()
+
+    def follower_fetch():
+        follower_calls.append(1)
+        return "follower result"
+
+    leader = threading.Thread(target=call, args=(blocked_fetch,))
+    leader.start()
+    while key not in manager._inflight:
+        time.sleep(0.001)
+
+    threads = [
+        threading.Thread(target=call, args=(follower_fetch,)) for _ in range(followers)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.2)  # let the followers reach the in-flight Future
+    release.set()
+    for thread in [leader] + threads:
+        thread.join(5)
+
+    assert key not in manager._inflight
+    return follower_calls, outcomes
+
+
+def test_single_flight_followers_share_one_fetch():
+    manager = order_manager.OrderManager("host")
+
+    follower_calls, outcomes = _run_single_flight(manager, lambda: "leader result")
+
+    assert follower_calls == []
+    assert outcomes == [("ok", "leader result")] * 5
+
+
+def test_single_flight_leader_error_reaches_followers():
+    manager = order_manager.OrderManager("host")
+    error = RuntimeError("boom")
+
+    def failing_fetch():
+        raise error
+
+    follower_calls, outcomes = _run_single_flight(manager, failing_fetch)
+
+    assert follower_calls == []
+    assert outcomes == [("error", error)] * 5
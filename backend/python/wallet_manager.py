@@ -4,11 +4,15 @@ WalletManager - Handle wallet authentication and connection for Polymarket
 
 import os
 import logging
+import functools
 from typing import Optional, Dict, Any
 from dotenv import load_dotenv
 
 logger = logging.getLogger(__name__)
 
+# Read .env once per process rather than on every WalletManager()
+load_dotenv()
+
 
 class WalletManager:
     """
@@ -16,11 +20,13 @@ class WalletManager:
     """
 
     def __init__(self):
-        load_dotenv()
         self.host = "https://clob.polymarket.com"
         self.api_key = os.getenv("POLYMARKET_API_KEY")
         self.api_passphrase = os.getenv("POLYMARKET_API_PASSPHRASE")
         self.wallet_private_key = os.getenv("WALLET_PRIVATE_KEY")
+        self._demo_mode = not all(
+            [self.api_key, self.api_passphrase, self.wallet_private_key]
+        )
 
         self._validate_credentials()
 
@@ -37,7 +43,7 @@ class WalletManager:
 
         if missing:
             logger.warning(
-                f"Missing required environment variables: {', '.join(missing)}"
+                "Missing required environment variables: %s", ", ".join(missing)
             )
             logger.warning("Running in DEMO MODE - no real trading will occur")
             logger.warning("Set credentials in .env file for production trading")
@@ -56,7 +62,7 @@ class WalletManager:
 
     def is_demo_mode(self) -> bool:
         """Check if running in demo mode (no real wallet)"""
-        return not all([self.api_key, self.api_passphrase, self.wallet_private_key])
+        return self._demo_mode
 
     @staticmethod
     def create_env_template() -> str:
@@ -73,3 +79,9 @@ WALLET_PRIVATE_KEY=your_private_key_here
 # WARNING: Keep this file secure and never commit to git!
 """
         return template
+
+
+@functools.lru_cache(maxsize=1)
+def get_wallet_manager() -> WalletManager:
+    """Process-wide WalletManager (credentials are read once)"""
+    return WalletManager()